@@ -0,0 +1,73 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Modules the batch entry points must be able to import cheaply
+ENTRY_MODULES = ["wordgame", "word_game", "word_game_gui"]
+
+# Imports that must stay lazy: none of these may load on a plain import
+LAZY_MODULES = ["tkinter", "numpy"]
+
+DEFAULT_BUDGET_MS = 50.0
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """Import a module in a fresh interpreter under -X importtime.
+
+    Returns the cumulative import time of the module in milliseconds and
+    the names of every module that was imported along the way.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=here, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    cumulative_us = 0
+    imported = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+def check(budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, float]:
+    """Measure every entry module; raise AssertionError on a regression"""
+    timings = {}
+    for module in ENTRY_MODULES:
+        elapsed, imported = measure(module)
+        timings[module] = elapsed
+        eager = [name for name in imported if name.split('.')[0] in LAZY_MODULES]
+        assert not eager, f"import {module} eagerly loads {', '.join(eager)}"
+        assert elapsed <= budget_ms, f"import {module} took {elapsed:.1f} ms (budget {budget_ms} ms)"
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check cold-start import time of the game modules")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="maximum cumulative import time per module")
+    args = parser.parse_args()
+
+    try:
+        timings = check(args.budget_ms)
+    except AssertionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    for module, elapsed in timings.items():
+        print(f"✅ {module}: {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Lets pytest import wordgame and the scripts when run from the repo root
@@ -0,0 +1,369 @@
+"""Profile scripted game sessions against a synthetic data set.
+
+Each pass builds a fresh data set in a temporary directory and plays
+scripted sessions through WordGame.play_game (login, quota, scoring,
+save_data, stats) and/or the GUI (driven by submit_guess on a headless Tk
+stub, so no display is needed). For every front end it writes:
+
+    <mode>.pstats      cProfile data (load with pstats or snakeviz)
+    <mode>.txt         top functions by cumulative time
+    <mode>.folded      collapsed stacks for flamegraph.pl / speedscope
+    <mode>.tracemalloc tracemalloc snapshot (Snapshot.load)
+    <mode>-alloc.txt   peak traced memory and top live allocation sites
+
+    python profile_sessions.py --users 100 --games 1000 --output-dir profiles
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from wordgame import WORDS, GameStore, check_guess, daily_cache, word_for_day
+
+PASSWORD = "secret123"
+OPENERS = ["AUDIO", "HOUSE", "PLANT", "LIGHT"]
+
+
+class _Widget:
+    """Accepts any Tk widget call and remembers nothing but text entry contents"""
+
+    def __init__(self, *args, **kwargs):
+        self.children = []
+        self.text = ""
+        if args and isinstance(args[0], _Widget):
+            args[0].children.append(self)
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    pack = grid = config = configure = bind = focus = title = geometry = mainloop = _noop
+
+    def destroy(self):
+        self.children = []
+
+    def winfo_children(self):
+        children, self.children = self.children, []
+        return children
+
+    def get(self):
+        return self.text
+
+    def insert(self, index, text):
+        self.text += text
+
+    def delete(self, first, last=None):
+        self.text = ""
+
+
+def headless_tk():
+    """Stand-ins for the tkinter module and messagebox used by word_game_gui"""
+    tk = types.ModuleType("tkinter")
+    tk.Tk = tk.Frame = tk.Label = tk.Button = tk.Entry = _Widget
+    tk.LEFT = "left"
+    tk.END = "end"
+
+    messagebox = types.ModuleType("tkinter.messagebox")
+    messagebox.showinfo = messagebox.showwarning = messagebox.showerror = lambda *args, **kwargs: "ok"
+    messagebox.askyesno = lambda *args, **kwargs: False
+    return tk, messagebox
+
+
+def make_dataset(directory: str, users: int, games: int, seed: int = 0) -> str:
+    """Write a synthetic game_data.json with valid past games; returns its path"""
+    rng = random.Random(seed)
+    usernames = [f"player_{i}" for i in range(users)]
+    data = {
+        'users': {
+            name: {
+                'password': PASSWORD,
+                'is_admin': i == 0,
+                'created_at': datetime(2025, 1, 1).isoformat()
+            }
+            for i, name in enumerate(usernames)
+        },
+        'games': []
+    }
+
+    start = datetime.now() - timedelta(days=365)
+    for _ in range(games):
+        played = start + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        target = word_for_day(played.date())
+        attempts = []
+        for attempt in range(5):
+            guess = target if rng.random() < 0.3 else rng.choice(WORDS)
+            attempts.append({'guess': guess, 'feedback': check_guess(guess, target)})
+            if guess == target:
+                break
+        data['games'].append({
+            'username': rng.choice(usernames),
+            'date': played.isoformat(),
+            'target_word': target,
+            'attempts': attempts,
+            'won': attempts[-1]['guess'] == target,
+            'attempts_used': len(attempts)
+        })
+
+    path = os.path.join(directory, "game_data.json")
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    return path
+
+
+def scripted_guesses(target: str, rng: random.Random) -> List[str]:
+    """A few common openers, then usually the answer"""
+    guesses = rng.sample(OPENERS, rng.randint(1, 4))
+    if rng.random() < 0.7:
+        guesses.append(target)
+    return guesses[:5]
+
+
+def cli_sessions(data_file: str, sessions: int, seed: int = 0, on_finish: Optional[Callable] = None):
+    """Run word_game.WordGame.play_game with scripted input and silenced output"""
+    import word_game
+
+    rng = random.Random(seed)
+    game = word_game.WordGame(data_file)
+    usernames = sorted(game.users)
+    try:
+        word_game.print = lambda *args, **kwargs: None
+        for i in range(sessions):
+            username = usernames[i % len(usernames)]
+            game.login(username, PASSWORD)
+            target = game.get_daily_cache().target
+            misses = itertools.cycle([word for word in WORDS if word != target])
+            guesses = itertools.chain(scripted_guesses(target, rng), misses)
+            word_game.input = lambda prompt="": next(guesses)
+            game.play_game(username)
+            game.get_user_stats(username)
+            if game.users[username]['is_admin']:
+                game.admin_dashboard()
+        if on_finish:
+            on_finish()
+    finally:
+        vars(word_game).pop('print', None)
+        vars(word_game).pop('input', None)
+        game.quota.close()
+
+
+def gui_sessions(data_file: str, sessions: int, seed: int = 0, on_finish: Optional[Callable] = None):
+    """Drive WordGameGUI through login, start_game and submit_guess events"""
+    import word_game_gui
+
+    word_game_gui.tk, word_game_gui.messagebox = headless_tk()
+    rng = random.Random(seed)
+    app = word_game_gui.WordGameGUI(data_file)
+    usernames = sorted(app.users)
+    for i in range(sessions):
+        app.logout()
+        app.username_entry.insert(0, usernames[i % len(usernames)])
+        app.password_entry.insert(0, PASSWORD)
+        app.login()
+        app.start_game()
+        if app.daily is None:
+            continue
+        for guess in scripted_guesses(app.target_word, rng) + OPENERS:
+            if app.game_over:
+                break
+            app.guess_entry.insert(0, guess)
+            app.submit_guess()
+        app.show_stats()
+        app.daily = None
+    if on_finish:
+        on_finish()
+    app.game.quota.close()
+
+
+SESSIONS = {
+    'cli': cli_sessions,
+    'gui': gui_sessions
+}
+
+
+class StackSampler:
+    """Samples the calling thread's Python stack from a background thread.
+
+    Sampling keeps overhead low enough for sessions that make millions of
+    calls (a tracing profiler would dominate the numbers it reports).
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _label(frame) -> str:
+        code = frame.f_code
+        return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+    def _sample(self, thread_id: int, done):
+        while not done.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def run(self, func: Callable, *args):
+        import threading
+
+        done = threading.Event()
+        sampler = threading.Thread(target=self._sample, args=(threading.get_ident(), done), daemon=True)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval / 2)
+        sampler.start()
+        try:
+            func(*args)
+        finally:
+            done.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+    def write(self, path: str):
+        """Write "frame;frame;frame samples" lines, heaviest first"""
+        with open(path, 'w') as f:
+            for stack, samples in sorted(self.stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{stack} {samples}\n")
+
+
+class PeakTracker:
+    """Peak traced memory overall and inside selected methods.
+
+    tracemalloc keeps a single peak, so it is reset on entry to each
+    tracked method and the overall peak is carried across resets.
+    """
+
+    PHASES = {
+        'GameStore.load (json.load)': (GameStore, 'load'),
+        'GameStore.save (save_data / json.dump)': (GameStore, 'save')
+    }
+
+    def __init__(self):
+        self.peak = 0
+        self.phases: Dict[str, int] = defaultdict(int)
+        self._originals = {}
+
+    def _observe(self):
+        import tracemalloc
+
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        import tracemalloc
+
+        def tracked(*args, **kwargs):
+            self._observe()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.phases[name] = max(self.phases[name], tracemalloc.get_traced_memory()[1] - before)
+                self._observe()
+
+        return tracked
+
+    def __enter__(self):
+        for name, (owner, attr) in self.PHASES.items():
+            self._originals[name] = getattr(owner, attr)
+            setattr(owner, attr, self._wrap(name, self._originals[name]))
+        return self
+
+    def __exit__(self, *exc):
+        for name, (owner, attr) in self.PHASES.items():
+            setattr(owner, attr, self._originals[name])
+        self._observe()
+
+
+def _fresh_run(users: int, games: int, sessions: int, func: Callable, runner: Callable):
+    """Run one pass against a new data set so passes don't share quota or history"""
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = make_dataset(directory, users, games)
+        daily_cache.reset_cache()
+        runner(func, data_file, sessions)
+
+
+def profile_mode(mode: str, users: int, games: int, sessions: int, output_dir: str, top: int):
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    func = SESSIONS[mode]
+    prefix = os.path.join(output_dir, mode)
+
+    profiler = cProfile.Profile()
+    _fresh_run(users, games, sessions, func, lambda f, *args: profiler.runcall(f, *args))
+    profiler.dump_stats(prefix + ".pstats")
+    with open(prefix + ".txt", 'w') as f:
+        pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(top)
+
+    sampler = StackSampler()
+    _fresh_run(users, games, sessions, func, sampler.run)
+    sampler.write(prefix + ".folded")
+
+    # Snapshot from inside the session, while the game, its loaded history
+    # and caches are still alive; the peak covers what was freed before that
+    captured = {}
+    peaks = PeakTracker()
+
+    def capture():
+        captured['snapshot'] = tracemalloc.take_snapshot()
+        captured['current'] = tracemalloc.get_traced_memory()[0]
+
+    def traced(f, *args):
+        tracemalloc.start(25)
+        try:
+            with peaks:
+                f(*args, on_finish=capture)
+        finally:
+            tracemalloc.stop()
+
+    _fresh_run(users, games, sessions, func, traced)
+    snapshot = captured['snapshot'].filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+    ])
+    snapshot.dump(prefix + ".tracemalloc")
+    stats = snapshot.statistics('lineno')
+    with open(prefix + "-alloc.txt", 'w') as f:
+        f.write(f"Allocations for {mode}, {sessions} sessions\n")
+        f.write(f"Peak traced memory: {peaks.peak / 1024:.1f} KiB\n")
+        f.write(f"Live at end of session: {captured['current'] / 1024:.1f} KiB\n\n")
+        f.write("Largest peak growth inside:\n")
+        for name, growth in sorted(peaks.phases.items(), key=lambda item: -item[1]):
+            f.write(f"  {name}: {growth / 1024:.1f} KiB\n")
+        f.write("\n")
+        f.write(f"Top {top} allocation sites still live at end of session:\n\n")
+        for stat in stats[:top]:
+            f.write(f"{stat}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile scripted game sessions offline")
+    parser.add_argument('--mode', choices=['cli', 'gui', 'all'], default='all')
+    parser.add_argument('--users', type=int, default=100, help="synthetic users")
+    parser.add_argument('--games', type=int, default=1000, help="synthetic past games")
+    parser.add_argument('--sessions', type=int, default=20, help="scripted sessions per pass")
+    parser.add_argument('--top', type=int, default=25, help="entries in the text reports")
+    parser.add_argument('--output-dir', default="profiles")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    modes = list(SESSIONS) if args.mode == 'all' else [args.mode]
+    for mode in modes:
+        started = time.perf_counter()
+        profile_mode(mode, args.users, args.games, args.sessions, args.output_dir, args.top)
+        print(f"✅ {mode}: profiles written to {args.output_dir}/{mode}.* "
+              f"({time.perf_counter() - started:.1f}s)")
+
+if __name__ == "__main__":
+    main()
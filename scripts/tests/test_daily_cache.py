@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+
+from wordgame import WORDS, check_guess, word_for_day
+from wordgame.calendar import build_calendar, encode_word
+from wordgame.daily_cache import DailyWordCache, get_cache, reset_cache
+
+DAY = date(2026, 1, 1)
+
+
+def test_repeated_guess_is_a_hit_with_the_same_feedback():
+    cache = DailyWordCache(DAY)
+    first = cache.check_guess('AUDIO')
+    second = cache.check_guess('audio')
+    assert first == second == check_guess('AUDIO', cache.target)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_returned_feedback_is_a_copy():
+    cache = DailyWordCache(DAY)
+    cache.check_guess('AUDIO')[0] = 'tampered'
+    assert cache.check_guess('AUDIO') == check_guess('AUDIO', cache.target)
+
+
+def test_least_recently_used_guess_is_evicted():
+    cache = DailyWordCache(DAY, maxsize=2)
+    cache.check_guess('AUDIO')
+    cache.check_guess('HOUSE')
+    cache.check_guess('AUDIO')
+    cache.check_guess('PLANT')
+    assert list(cache.feedback) == ['AUDIO', 'PLANT']
+
+
+def test_get_cache_changes_with_day_and_word_list():
+    reset_cache()
+    cache = get_cache(DAY)
+    assert get_cache(DAY) is cache
+    assert get_cache(DAY + timedelta(days=1)) is not cache
+
+    other = get_cache(DAY, words=['HOUSE'])
+    assert other.target == 'HOUSE'
+    assert get_cache(DAY) is not other
+    reset_cache()
+
+
+def test_calendar_matches_daily_words():
+    calendar = build_calendar(DAY, 5)
+    assert [entry['date'] for entry in calendar] == [(DAY + timedelta(days=i)).isoformat() for i in range(5)]
+    for i, entry in enumerate(calendar):
+        word = word_for_day(DAY + timedelta(days=i), WORDS)
+        assert entry['word'] == word
+        assert entry['encoded'] == encode_word(word)
+    assert encode_word('AAAAA') == 0b00001_00001_00001_00001_00001
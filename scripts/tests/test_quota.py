@@ -0,0 +1,62 @@
+import os
+from multiprocessing import Pool
+
+from wordgame import WordGame
+from wordgame import quota
+from wordgame.quota import QuotaService
+
+
+def test_exactly_limit_games_are_granted(tmp_path):
+    service = QuotaService(str(tmp_path / "quota.db"))
+    assert [service.try_consume('alice') for _ in range(4)] == [True, True, True, False]
+    assert service.used('alice') == 3
+    assert not service.can_play('alice')
+
+
+def test_limits_are_per_tier(tmp_path):
+    service = QuotaService(str(tmp_path / "quota.db"), limits={'admin': 5, 'regular': 2})
+    assert sum(service.try_consume('boss', 'admin') for _ in range(7)) == 5
+    assert sum(service.try_consume('alice', 'regular') for _ in range(7)) == 2
+    # Unknown tiers fall back to the regular limit
+    assert service.limit('guest') == 2
+    assert sum(service.try_consume('guest', 'guest') for _ in range(7)) == 2
+
+
+def test_new_day_starts_from_zero_and_past_days_expire(tmp_path, monkeypatch):
+    service = QuotaService(str(tmp_path / "quota.db"))
+    monkeypatch.setattr(quota, 'epoch_day', lambda day=None: 100)
+    for _ in range(3):
+        service.try_consume('alice')
+    assert not service.can_play('alice')
+
+    monkeypatch.setattr(quota, 'epoch_day', lambda day=None: 101)
+    assert service.used('alice') == 0
+    assert service.used('alice', day=100) == 3  # reads leave old days alone
+    assert service.try_consume('alice')
+    assert service.used('alice', day=100) == 0
+
+
+def test_reads_do_not_create_the_store(tmp_path):
+    data_file = str(tmp_path / "game_data.json")
+    game = WordGame(data_file)
+    game.store.load()
+    game.users['bob'] = {'password': 'secret1', 'is_admin': False, 'created_at': ''}
+    assert game.get_user_stats('bob')['games_today'] == 0
+    assert game.can_play_game('bob')
+    game.admin_dashboard()
+    assert not os.path.exists(game.quota.path)
+
+
+def _consume(path):
+    service = QuotaService(path)
+    try:
+        return sum(service.try_consume('alice') for _ in range(5))
+    finally:
+        service.close()
+
+
+def test_limit_holds_across_processes(tmp_path):
+    path = str(tmp_path / "quota.db")
+    QuotaService(path).try_consume('warmup')  # create the table before the race
+    with Pool(8) as pool:
+        assert sum(pool.map(_consume, [path] * 8)) == 3
@@ -0,0 +1,66 @@
+import itertools
+import json
+from datetime import date
+
+from wordgame import check_guess, word_for_day
+from wordgame.replay import _verify_with_end, verify_chunk
+
+TODAY = date.today()
+TARGET = word_for_day(TODAY)
+
+
+def game(**overrides):
+    record = {
+        'username': 'alice',
+        'date': TODAY.isoformat() + 'T12:00:00',
+        'target_word': TARGET,
+        'attempts': [{'guess': TARGET, 'feedback': check_guess(TARGET, TARGET)}],
+        'won': True,
+        'attempts_used': 1
+    }
+    record.update(overrides)
+    return record
+
+
+def problems(record):
+    flagged = verify_chunk([(0, record)])
+    return flagged[0]['problems'] if flagged else []
+
+
+def test_valid_record_is_not_flagged():
+    assert problems(game()) == []
+
+
+def test_tampered_feedback_is_flagged():
+    record = game(attempts=[{'guess': TARGET, 'feedback': ['grey'] * 5}])
+    assert any('feedback' in problem for problem in problems(record))
+
+
+def test_unparseable_line_is_flagged():
+    next_index, flagged = _verify_with_end([(0, '{"username": '), (1, json.dumps(game()))])
+    assert next_index == 2
+    assert flagged == [{'index': 0, 'username': None, 'date': None, 'problems': ["unparseable record"]}]
+
+
+def test_record_that_is_not_an_object_is_flagged():
+    assert problems([1, 2]) == ["record is not an object"]
+
+
+def test_attempts_that_are_not_a_list_are_flagged():
+    assert problems(game(attempts=7)) == ["attempts is not a list: 7"]
+
+
+def test_attempt_that_is_not_an_object_is_flagged():
+    assert "attempt 1 is not an object" in problems(game(attempts=['AUDIO']))
+
+
+def test_non_ascii_words_are_rejected():
+    assert problems(game(target_word='ÉCOLE')) == ["invalid target_word 'ÉCOLE'"]
+
+    # Enough distinct guesses for check_guesses to take its NumPy path
+    guesses = [''.join(letters) for letters in itertools.islice(itertools.product('ABCDE', repeat=5), 70)]
+    attempts = [{'guess': guess, 'feedback': check_guess(guess, TARGET)} for guess in guesses[:4]]
+    chunk = [(i, game(attempts=[{'guess': guess, 'feedback': []}], won=False)) for i, guess in enumerate(guesses)]
+    chunk.append((70, game(attempts=attempts + [{'guess': 'ÉCOLE', 'feedback': []}], won=False, attempts_used=5)))
+    flagged = verify_chunk(chunk)
+    assert "attempt 5: invalid guess 'ÉCOLE'" in flagged[-1]['problems']
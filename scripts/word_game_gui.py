@@ -1,18 +1,24 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
-import random
-from datetime import datetime, date
-from typing import Dict, List
+from wordgame import WordGame
+
+# tkinter is imported by _load_tk() when a window is created, so importing
+# this module (e.g. to reuse its logic) does not pull in Tk.
+tk = None
+messagebox = None
+
+def _load_tk():
+    """Import tkinter on first use"""
+    global tk, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import messagebox as tk_messagebox
+        tk = tkinter
+        messagebox = tk_messagebox
 
 class WordGameGUI:
-    def __init__(self):
-        self.words = [
-            "AUDIO", "HOUSE", "PLANT", "WORLD", "MUSIC",
-            "LIGHT", "WATER", "POWER", "MONEY", "RIGHT",
-            "GREAT", "SMALL", "LARGE", "YOUNG", "EARLY",
-            "PLACE", "POINT", "HEART", "PARTY", "STORY"
-        ]
+    def __init__(self, data_file: str = "game_data.json"):
+        _load_tk()
+        self.game = WordGame(data_file)
+        self.words = self.game.words
         
         self.root = tk.Tk()
         self.root.title("Word Guess Game")
@@ -21,29 +27,25 @@ class WordGameGUI:
         
         self.current_user = None
         self.target_word = ""
+        self.daily = None
+        self.attempts = []
         self.current_row = 0
         self.current_col = 0
         self.game_over = False
         
-        self.load_data()
         self.create_login_screen()
     
+    @property
+    def users(self):
+        return self.game.users
+    
     def load_data(self):
         """Load game data from JSON file"""
-        try:
-            with open("game_data.json", 'r') as f:
-                data = json.load(f)
-                self.users = data.get('users', {})
-                self.games = data.get('games', [])
-        except FileNotFoundError:
-            self.users = {}
-            self.games = []
+        self.game.load_data()
     
     def save_data(self):
         """Save game data to JSON file"""
-        data = {'users': self.users, 'games': self.games}
-        with open("game_data.json", 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        self.game.save_data()
     
     def create_login_screen(self):
         """Create the login interface"""
@@ -83,7 +85,7 @@ class WordGameGUI:
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         
-        if username in self.users and self.users[username]['password'] == password:
+        if self.game.login(username, password):
             self.current_user = username
             self.create_main_menu()
         else:
@@ -94,33 +96,17 @@ class WordGameGUI:
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         
-        if not username or not password:
-            messagebox.showerror("Error", "Please enter username and password")
-            return
-        
-        if username in self.users:
-            messagebox.showerror("Error", "Username already exists")
-            return
-        
-        if not (3 <= len(username) <= 20 and username.replace('_', '').isalnum()):
-            messagebox.showerror("Error", "Username must be 3-20 characters, letters/numbers/underscore only")
-            return
-        
-        if not (6 <= len(password) <= 50):
-            messagebox.showerror("Error", "Password must be 6-50 characters")
+        error = self.game.registration_error(username, password)
+        if error:
+            messagebox.showerror("Error", error)
             return
         
         is_admin = messagebox.askyesno("Admin Account", "Create as admin account?")
         
-        self.users[username] = {
-            'password': password,
-            'is_admin': is_admin,
-            'created_at': datetime.now().isoformat(),
-            'games_today': 0,
-            'last_game_date': None
-        }
-        self.save_data()
-        messagebox.showinfo("Success", f"User '{username}' registered successfully!")
+        if self.game.register_user(username, password, is_admin):
+            messagebox.showinfo("Success", f"User '{username}' registered successfully!")
+        else:
+            messagebox.showerror("Error", "Registration failed")
     
     def create_main_menu(self):
         """Create the main menu interface"""
@@ -154,34 +140,19 @@ class WordGameGUI:
     
     def start_game(self):
         """Start a new game"""
-        if not self.can_play_game():
-            messagebox.showwarning("Limit Reached", "You've reached your daily limit of 3 games!")
+        if not self.game.start_game(self.current_user):
+            limit = self.game.daily_limit(self.current_user)
+            messagebox.showwarning("Limit Reached", f"You've reached your daily limit of {limit} games!")
             return
         
-        self.target_word = self.get_daily_word()
+        self.daily = self.game.get_daily_cache()
+        self.target_word = self.daily.target
+        self.attempts = []
         self.current_row = 0
         self.current_col = 0
         self.game_over = False
         self.create_game_screen()
     
-    def can_play_game(self):
-        """Check if user can play a game today"""
-        user = self.users[self.current_user]
-        today = date.today().isoformat()
-        
-        if user['last_game_date'] != today:
-            user['games_today'] = 0
-            user['last_game_date'] = today
-            self.save_data()
-        
-        return user['games_today'] < 3
-    
-    def get_daily_word(self):
-        """Get today's word"""
-        today = date.today()
-        random.seed(today.toordinal())
-        return random.choice(self.words)
-    
     def create_game_screen(self):
         """Create the game interface"""
         self.clear_screen()
@@ -221,11 +192,18 @@ class WordGameGUI:
         
         # Back button
         back_btn = tk.Button(self.root, text="← Back to Menu", font=("Arial", 10),
-                           bg='#757575', fg='white', command=self.create_main_menu)
+                           bg='#757575', fg='white', command=self.leave_game)
         back_btn.pack(pady=10)
         
         self.guess_entry.focus()
     
+    def leave_game(self):
+        """Return to the menu, warning that an unfinished game still counts"""
+        if not self.game_over and not messagebox.askyesno(
+                "Leave Game", "This game already counts toward today's limit. Leave anyway?"):
+            return
+        self.create_main_menu()
+    
     def submit_guess(self):
         """Handle guess submission"""
         if self.game_over:
@@ -238,7 +216,8 @@ class WordGameGUI:
             return
         
         # Update grid
-        feedback = self.check_guess(guess, self.target_word)
+        feedback = self.daily.check_guess(guess)
+        self.attempts.append({'guess': guess, 'feedback': feedback})
         
         for col in range(5):
             cell = self.cells[self.current_row][col]
@@ -255,91 +234,49 @@ class WordGameGUI:
         if guess == self.target_word:
             self.game_over = True
             messagebox.showinfo("Congratulations!", f"You guessed the word '{self.target_word}' in {self.current_row + 1} attempts!")
-            self.record_game(True, self.current_row + 1)
+            self.record_game(True)
         elif self.current_row >= 4:
             self.game_over = True
             messagebox.showinfo("Game Over", f"The word was '{self.target_word}'")
-            self.record_game(False, 5)
+            self.record_game(False)
         
         self.current_row += 1
         self.guess_entry.delete(0, tk.END)
     
-    def check_guess(self, guess, target):
-        """Check guess and return feedback"""
-        result = ['grey'] * 5
-        target_chars = list(target)
-        guess_chars = list(guess)
-        
-        # Mark correct positions
-        for i in range(5):
-            if guess_chars[i] == target_chars[i]:
-                result[i] = 'green'
-                target_chars[i] = None
-                guess_chars[i] = None
-        
-        # Mark wrong positions
-        for i in range(5):
-            if guess_chars[i] is not None and guess_chars[i] in target_chars:
-                result[i] = 'yellow'
-                target_chars[target_chars.index(guess_chars[i])] = None
-        
-        return result
-    
-    def record_game(self, won, attempts):
+    def record_game(self, won):
         """Record game result"""
-        game_record = {
-            'username': self.current_user,
-            'date': datetime.now().isoformat(),
-            'target_word': self.target_word,
-            'won': won,
-            'attempts_used': attempts
-        }
-        
-        self.games.append(game_record)
-        self.users[self.current_user]['games_today'] += 1
-        self.save_data()
+        self.game.record_game(self.current_user, self.target_word, self.attempts, won)
     
     def show_stats(self):
         """Show user statistics"""
-        user_games = [g for g in self.games if g['username'] == self.current_user]
+        stats = self.game.get_user_stats(self.current_user)
         
-        if not user_games:
+        if stats['total_games'] == 0:
             stats_text = "No games played yet!"
         else:
-            games_won = sum(1 for g in user_games if g['won'])
-            total_attempts = sum(g['attempts_used'] for g in user_games)
-            win_rate = round((games_won / len(user_games)) * 100, 1)
-            avg_attempts = round(total_attempts / len(user_games), 1)
-            
             stats_text = f"""📊 Your Statistics:
             
-Total Games: {len(user_games)}
-Games Won: {games_won}
-Win Rate: {win_rate}%
-Average Attempts: {avg_attempts}
-Games Today: {self.users[self.current_user]['games_today']}/3"""
+Total Games: {stats['total_games']}
+Games Won: {stats['games_won']}
+Win Rate: {stats['win_rate']}%
+Average Attempts: {stats['average_attempts']}
+Games Today: {stats['games_today']}/{self.game.daily_limit(self.current_user)}"""
         
         messagebox.showinfo("Your Statistics", stats_text)
     
     def show_admin_dashboard(self):
         """Show admin dashboard"""
-        total_users = len(self.users)
-        total_games = len(self.games)
+        dashboard = self.game.admin_dashboard()
         
-        if total_games == 0:
-            dashboard_text = f"👑 Admin Dashboard:\n\nTotal Users: {total_users}\nTotal Games: 0"
+        if dashboard['total_games'] == 0:
+            dashboard_text = f"👑 Admin Dashboard:\n\nTotal Users: {dashboard['total_users']}\nTotal Games: 0"
         else:
-            games_won = sum(1 for g in self.games if g['won'])
-            total_attempts = sum(g['attempts_used'] for g in self.games)
-            win_rate = round((games_won / total_games) * 100, 1)
-            avg_attempts = round(total_attempts / total_games, 1)
-            
             dashboard_text = f"""👑 Admin Dashboard:
             
-Total Users: {total_users}
-Total Games: {total_games}
-Overall Win Rate: {win_rate}%
-Average Attempts: {avg_attempts}"""
+Total Users: {dashboard['total_users']}
+Total Games: {dashboard['total_games']}
+Overall Win Rate: {dashboard['overall_win_rate']}%
+Average Attempts: {dashboard['average_attempts']}"""
         
         messagebox.showinfo("Admin Dashboard", dashboard_text)
     
@@ -0,0 +1,11 @@
+"""Core Word Guess Game logic shared by the CLI, the GUI and batch jobs.
+
+Importing this package pulls in no GUI toolkit, NumPy or data files; those
+are loaded on first use.
+"""
+from .game import WordGame
+from .scoring import check_guess, check_guesses
+from .storage import GameStore
+from .words import WORDS, word_for_day
+
+__all__ = ['WordGame', 'GameStore', 'WORDS', 'check_guess', 'check_guesses', 'word_for_day']
@@ -0,0 +1,55 @@
+"""Precompute the daily word calendar.
+
+Emits the next N days of words and their encoded forms so operators can
+see upcoming words ahead of midnight rollover. The calendar is output
+only; live games get their word from daily_cache.get_cache.
+
+    python -m wordgame.calendar --days 30 --output calendar.json
+"""
+import argparse
+import json
+from datetime import date, timedelta
+from typing import Dict, List
+
+from .words import WORDS, word_for_day
+
+
+def encode_word(word: str) -> int:
+    """Pack a 5-letter word into an int, 5 bits per letter (A=1 .. Z=26)"""
+    code = 0
+    for char in word.upper():
+        code = (code << 5) | (ord(char) - 64)
+    return code
+
+
+def build_calendar(start: date, days: int, words: List[str] = WORDS) -> List[Dict]:
+    """Precompute the daily words and their encoded forms for the next N days"""
+    calendar = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        word = word_for_day(day, words)
+        calendar.append({
+            'date': day.isoformat(),
+            'word': word,
+            'encoded': encode_word(word)
+        })
+    return calendar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the daily word calendar")
+    parser.add_argument('--days', type=int, default=30, help="number of days to emit")
+    parser.add_argument('--start', type=date.fromisoformat, default=date.today(),
+                        help="first day (YYYY-MM-DD), defaults to today")
+    parser.add_argument('--output', help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    calendar = build_calendar(args.start, args.days)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(calendar, f, indent=2)
+    else:
+        print(json.dumps(calendar, indent=2))
+
+if __name__ == "__main__":
+    main()
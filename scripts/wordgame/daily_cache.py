@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .scoring import check_guess
+from .words import WORDS, word_for_day
+
+FEEDBACK_CACHE_SIZE = 4096
+
+
+class DailyWordCache:
+    """A day's target word plus an LRU table of guess -> feedback"""
+
+    def __init__(self, day: date, words: List[str] = WORDS, maxsize: int = FEEDBACK_CACHE_SIZE):
+        self.day = day
+        self.target = word_for_day(day, words)
+        self.maxsize = maxsize
+        self.feedback: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def check_guess(self, guess: str) -> List[str]:
+        """Return color feedback for a guess, scoring it at most once per day"""
+        guess = guess.upper()
+        cached = self.feedback.get(guess)
+        if cached is not None:
+            self.hits += 1
+            self.feedback.move_to_end(guess)
+            return list(cached)
+
+        self.misses += 1
+        result = check_guess(guess, self.target)
+        self.feedback[guess] = tuple(result)
+        if len(self.feedback) > self.maxsize:
+            self.feedback.popitem(last=False)
+        return result
+
+    def stats(self) -> Dict:
+        """Get cache statistics for the day"""
+        return {
+            'date': self.day.isoformat(),
+            'entries': len(self.feedback),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+_current: Optional[DailyWordCache] = None
+_current_key: Optional[Tuple] = None
+
+
+def get_cache(day: Optional[date] = None, words: List[str] = WORDS) -> DailyWordCache:
+    """Get the shared cache for a day and word list, replacing it at midnight rollover"""
+    global _current, _current_key
+    key = (day or date.today(), tuple(words))
+    if _current_key != key:
+        _current = DailyWordCache(key[0], words)
+        _current_key = key
+    return _current
+
+
+def reset_cache():
+    """Drop the shared cache so the next get_cache starts cold"""
+    global _current, _current_key
+    _current = None
+    _current_key = None
@@ -0,0 +1,177 @@
+from datetime import datetime, date
+from typing import Dict, List, Optional
+
+from .daily_cache import get_cache
+from .quota import QuotaService, quota_file_for, user_tier
+from .scoring import check_guess
+from .storage import GameStore
+from .words import WORDS, word_for_day
+
+
+class WordGame:
+    """Game rules, accounts and statistics, with no terminal or GUI code"""
+
+    def __init__(self, data_file: str = "game_data.json", quota: Optional[QuotaService] = None):
+        self.words = WORDS
+        self.data_file = data_file
+        self.store = GameStore(data_file)
+        # Daily limits live beside the data file, never in the user records
+        self.quota = quota or QuotaService(quota_file_for(data_file))
+
+    @property
+    def users(self) -> Dict:
+        return self.store.users
+
+    @property
+    def games(self) -> List:
+        return self.store.games
+
+    def load_data(self):
+        """Load user data and game history from JSON file"""
+        self.store.load()
+
+    def save_data(self):
+        """Save user data and game history to JSON file"""
+        self.store.save()
+
+    def registration_error(self, username: str, password: str) -> Optional[str]:
+        """Explain why a registration would be rejected, or None if it is valid"""
+        if not username or not password:
+            return "Please enter username and password"
+
+        if username in self.users:
+            return "Username already exists"
+
+        # Validate username (3-20 chars, alphanumeric + underscore)
+        if not (3 <= len(username) <= 20 and username.replace('_', '').isalnum()):
+            return "Username must be 3-20 characters, letters/numbers/underscore only"
+
+        # Validate password (6-50 chars)
+        if not (6 <= len(password) <= 50):
+            return "Password must be 6-50 characters"
+
+        return None
+
+    def register_user(self, username: str, password: str, is_admin: bool = False) -> bool:
+        """Register a new user"""
+        if self.registration_error(username, password):
+            return False
+
+        self.users[username] = {
+            'password': password,
+            'is_admin': is_admin,
+            'created_at': datetime.now().isoformat()
+        }
+        self.save_data()
+        return True
+
+    def login(self, username: str, password: str) -> Optional[Dict]:
+        """Authenticate user login"""
+        if username not in self.users:
+            return None
+        if self.users[username]['password'] != password:
+            return None
+        return self.users[username]
+
+    def daily_limit(self, username: str) -> int:
+        """Games per day allowed for a user's tier"""
+        return self.quota.limit(user_tier(self.users[username]))
+
+    def can_play_game(self, username: str) -> bool:
+        """Check if user can play a game today"""
+        return self.quota.can_play(username, user_tier(self.users[username]))
+
+    def start_game(self, username: str) -> bool:
+        """Use one of today's games; False when the daily limit is reached"""
+        return self.quota.try_consume(username, user_tier(self.users[username]))
+
+    def get_daily_word(self) -> str:
+        """Get the word for today (same word for all players each day)"""
+        return word_for_day(date.today(), self.words)
+
+    def get_daily_cache(self):
+        """Get the shared feedback cache for today's word"""
+        return get_cache(words=self.words)
+
+    def check_guess(self, guess: str, target: str) -> List[str]:
+        """Check guess against target word and return color feedback"""
+        return check_guess(guess, target)
+
+    def record_game(self, username: str, target_word: str, attempts: List[Dict], won: bool) -> Dict:
+        """Append a finished game to the history"""
+        game_record = {
+            'username': username,
+            'date': datetime.now().isoformat(),
+            'target_word': target_word,
+            'attempts': attempts,
+            'won': won,
+            'attempts_used': len(attempts)
+        }
+
+        self.games.append(game_record)
+        self.save_data()
+
+        return game_record
+
+    def get_user_stats(self, username: str) -> Dict:
+        """Get statistics for a specific user"""
+        user_games = [g for g in self.games if g['username'] == username]
+
+        if not user_games:
+            return {
+                'total_games': 0,
+                'games_won': 0,
+                'win_rate': 0,
+                'average_attempts': 0,
+                'games_today': self.quota.used(username)
+            }
+
+        games_won = sum(1 for g in user_games if g['won'])
+        total_attempts = sum(g['attempts_used'] for g in user_games)
+
+        return {
+            'total_games': len(user_games),
+            'games_won': games_won,
+            'win_rate': round((games_won / len(user_games)) * 100, 1),
+            'average_attempts': round(total_attempts / len(user_games), 1),
+            'games_today': self.quota.used(username)
+        }
+
+    def admin_dashboard(self) -> Dict:
+        """Get comprehensive statistics for admin users"""
+        total_users = len(self.users)
+        total_games = len(self.games)
+
+        if total_games == 0:
+            return {
+                'total_users': total_users,
+                'total_games': 0,
+                'overall_win_rate': 0,
+                'average_attempts': 0,
+                'top_players': []
+            }
+
+        games_won = sum(1 for g in self.games if g['won'])
+        total_attempts = sum(g['attempts_used'] for g in self.games)
+
+        # Calculate top players
+        user_stats = {}
+        for username in self.users:
+            if not self.users[username]['is_admin']:
+                stats = self.get_user_stats(username)
+                if stats['total_games'] > 0:
+                    user_stats[username] = stats
+
+        top_players = sorted(
+            user_stats.items(),
+            key=lambda x: (x[1]['win_rate'], -x[1]['average_attempts']),
+            reverse=True
+        )[:5]
+
+        return {
+            'total_users': total_users,
+            'total_games': total_games,
+            'overall_win_rate': round((games_won / total_games) * 100, 1),
+            'average_attempts': round(total_attempts / total_games, 1),
+            'top_players': top_players
+        }
@@ -0,0 +1,101 @@
+import os
+from datetime import date
+from typing import Dict, Optional
+
+DEFAULT_LIMITS = {
+    'regular': 3,
+    'admin': 3
+}
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def quota_file_for(data_file: str) -> str:
+    """Quota store that sits beside a game data file"""
+    return os.path.splitext(data_file)[0] + "_quota.db"
+
+
+def epoch_day(day: Optional[date] = None) -> int:
+    """Days since 1970-01-01 for a local date (today by default)"""
+    return (day or date.today()).toordinal() - _EPOCH
+
+
+def user_tier(user: Dict) -> str:
+    """Quota tier for a user record"""
+    return 'admin' if user.get('is_admin') else 'regular'
+
+
+class QuotaService:
+    """Daily game quota, counted per (user, epoch-day) in a small SQLite file.
+
+    Counters for a new day start from zero simply by using a new key, so
+    rollover writes nothing; rows from past days are dropped by the first
+    try_consume on a later day. Reads never create or modify the store.
+    Checks and increments are single SQL statements, which keeps them
+    atomic across processes.
+    """
+
+    def __init__(self, path: str = quota_file_for("game_data.json"), limits: Optional[Dict[str, int]] = None):
+        self.path = path
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self._conn = None
+        self._swept_day = None
+
+    def _connect(self):
+        """Open the store on first use, creating it if needed"""
+        if self._conn is None:
+            import sqlite3
+
+            self._conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota ("
+                " day INTEGER NOT NULL,"
+                " username TEXT NOT NULL,"
+                " used INTEGER NOT NULL,"
+                " PRIMARY KEY (day, username)"
+                ") WITHOUT ROWID"
+            )
+        return self._conn
+
+    def limit(self, tier: str) -> int:
+        """Games per day allowed for a tier"""
+        return self.limits.get(tier, self.limits['regular'])
+
+    def used(self, username: str, day: Optional[int] = None) -> int:
+        """Games already counted for a user on a day (today by default)"""
+        if self._conn is None and not os.path.exists(self.path):
+            return 0
+        day = epoch_day() if day is None else day
+        row = self._connect().execute(
+            "SELECT used FROM quota WHERE day = ? AND username = ?", (day, username)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def can_play(self, username: str, tier: str = 'regular') -> bool:
+        """Check whether a user has a game left today, without using it"""
+        return self.used(username) < self.limit(tier)
+
+    def try_consume(self, username: str, tier: str = 'regular') -> bool:
+        """Atomically use one game from today's quota; False if none are left"""
+        limit = self.limit(tier)
+        if limit <= 0:
+            return False
+        day = epoch_day()
+        conn = self._connect()
+        if self._swept_day != day:
+            conn.execute("DELETE FROM quota WHERE day < ?", (day,))
+            self._swept_day = day
+        cursor = conn.execute(
+            "INSERT INTO quota (day, username, used) VALUES (?, ?, 1)"
+            " ON CONFLICT (day, username) DO UPDATE SET used = used + 1"
+            " WHERE used < ?",
+            (day, username, limit)
+        )
+        return cursor.rowcount == 1
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
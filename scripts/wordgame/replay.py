@@ -0,0 +1,297 @@
+"""Replay recorded games and flag records whose stored results don't add up.
+
+Every attempt is re-scored through the same rules as check_guess and
+compared with its stored feedback; won and attempts_used are checked
+against the attempts themselves, and target_word against the daily word.
+Work is split into chunks that run in parallel, and a checkpoint file
+lets nightly runs pick up where the previous one stopped.
+
+    python -m wordgame.replay game_data.json --checkpoint replay.ckpt
+"""
+import json
+import os
+import sys
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .scoring import check_guesses
+from .words import WORDS, word_for_day
+
+MAX_ATTEMPTS = 5
+CHUNK_SIZE = 10000
+
+
+def iter_games(path: str, start: int = 0) -> Iterator[Tuple[int, Dict]]:
+    """Yield (index, record) pairs from a game history file, skipping the first `start`.
+
+    A .jsonl file (one record per line) is streamed; anything else is
+    read as the game_data.json layout written by GameStore.
+    """
+    for index, record in _iter_raw(path, start):
+        yield index, json.loads(record) if isinstance(record, str) else record
+
+
+def _iter_raw(path: str, start: int) -> Iterator[Tuple[int, object]]:
+    """Like iter_games, but .jsonl lines are left undecoded for the workers"""
+    if path.endswith('.jsonl'):
+        with open(path, 'r') as f:
+            for index, line in enumerate(f):
+                if index >= start and line.strip():
+                    yield index, line
+    else:
+        with open(path, 'r') as f:
+            games = json.load(f).get('games', [])
+        for index in range(start, len(games)):
+            yield index, games[index]
+
+
+def _chunks(records: Iterator[Tuple[int, Dict]], size: int) -> Iterator[List[Tuple[int, Dict]]]:
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _valid_word(word) -> bool:
+    """Five ASCII capital letters, the only words the game produces"""
+    return (isinstance(word, str) and len(word) == 5
+            and word.isascii() and word.isalpha() and word.isupper())
+
+
+def _flag(index: int, record, problems: List[str]) -> Dict:
+    if not isinstance(record, dict):
+        record = {}
+    return {
+        'index': index,
+        'username': record.get('username'),
+        'date': record.get('date'),
+        'problems': problems
+    }
+
+
+@lru_cache(maxsize=4096)
+def _expected_targets(day_text: str) -> Tuple[str, ...]:
+    """Daily words a record dated `day_text` may have; a game can span midnight"""
+    try:
+        day = date.fromisoformat(day_text)
+    except ValueError:
+        return ()
+    return (word_for_day(day, WORDS), word_for_day(day - timedelta(days=1), WORDS))
+
+
+def verify_record(record: Dict, feedback: Dict[Tuple[str, str], List[str]]) -> List[str]:
+    """List the problems with one record; `feedback` maps (target, guess) to the true feedback"""
+    if not isinstance(record, dict):
+        return ["record is not an object"]
+
+    problems = []
+    target = record.get('target_word')
+    if not _valid_word(target):
+        return [f"invalid target_word {target!r}"]
+
+    expected = _expected_targets(str(record.get('date'))[:10])
+    if not expected:
+        problems.append(f"invalid date {record.get('date')!r}")
+    elif target not in expected:
+        problems.append(f"target_word {target} is not the daily word for {record.get('date')}")
+
+    attempts_used = record.get('attempts_used')
+    won = record.get('won')
+    attempts = record.get('attempts')
+
+    if attempts is None:
+        # Records from before attempts were stored can only be range-checked
+        if not (isinstance(attempts_used, int) and 1 <= attempts_used <= MAX_ATTEMPTS):
+            problems.append(f"attempts_used {attempts_used!r} out of range")
+        elif not won and attempts_used != MAX_ATTEMPTS:
+            problems.append(f"lost game with attempts_used {attempts_used}")
+        return problems
+
+    if not isinstance(attempts, list):
+        problems.append(f"attempts is not a list: {attempts!r}")
+        return problems
+
+    if not 1 <= len(attempts) <= MAX_ATTEMPTS:
+        problems.append(f"{len(attempts)} attempts recorded")
+    if attempts_used != len(attempts):
+        problems.append(f"attempts_used {attempts_used!r} but {len(attempts)} attempts recorded")
+
+    solved_at = None
+    for i, attempt in enumerate(attempts):
+        if not isinstance(attempt, dict):
+            problems.append(f"attempt {i + 1} is not an object")
+            continue
+        guess = attempt.get('guess')
+        expected_feedback = feedback.get((target, guess)) if isinstance(guess, str) else None
+        if expected_feedback is None:
+            # verify_chunk scores every valid guess, so anything missing is malformed
+            problems.append(f"attempt {i + 1}: invalid guess {guess!r}")
+            continue
+        if attempt.get('feedback') != expected_feedback:
+            problems.append(f"attempt {i + 1}: feedback for {guess} does not match {target}")
+        if guess == target and solved_at is None:
+            solved_at = i
+
+    if solved_at is not None and solved_at != len(attempts) - 1:
+        problems.append(f"attempts continue after the word was guessed at attempt {solved_at + 1}")
+    if bool(won) != (solved_at is not None):
+        problems.append(f"won is {won!r} but the word was {'' if solved_at is not None else 'not '}guessed")
+    elif not won and len(attempts) != MAX_ATTEMPTS:
+        problems.append(f"lost game ended after {len(attempts)} attempts")
+
+    return problems
+
+
+def verify_chunk(chunk: List[Tuple[int, Dict]]) -> List[Dict]:
+    """Verify a chunk of records, scoring each distinct (target, guess) pair once"""
+    guesses_by_target: Dict[str, set] = {}
+    for _, record in chunk:
+        if not isinstance(record, dict):
+            continue
+        target = record.get('target_word')
+        attempts = record.get('attempts')
+        if not _valid_word(target) or not isinstance(attempts, list):
+            continue
+        for attempt in attempts:
+            guess = attempt.get('guess') if isinstance(attempt, dict) else None
+            if isinstance(guess, str):
+                guesses_by_target.setdefault(target, set()).add(guess)
+
+    feedback = {}
+    for target, guesses in guesses_by_target.items():
+        guesses = sorted(guess for guess in guesses if _valid_word(guess))
+        for guess, result in zip(guesses, check_guesses(guesses, target)):
+            feedback[(target, guess)] = result
+
+    flagged = []
+    for index, record in chunk:
+        problems = verify_record(record, feedback)
+        if problems:
+            flagged.append(_flag(index, record, problems))
+    return flagged
+
+
+def load_checkpoint(path: Optional[str], source: str) -> int:
+    """Get the index to resume from, or 0 when there is no checkpoint for this source"""
+    if not path:
+        return 0
+    try:
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if checkpoint.get('source') != source:
+        return 0
+    return checkpoint.get('next_index', 0)
+
+
+def save_checkpoint(path: str, source: str, next_index: int):
+    """Record how far a run got; written to a temp file and swapped in"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({
+            'source': source,
+            'next_index': next_index,
+            'updated_at': datetime.now().isoformat()
+        }, f)
+    os.replace(tmp_path, path)
+
+
+def _verify_with_end(chunk: List[Tuple[int, object]]) -> Tuple[int, List[Dict]]:
+    """Decode any raw lines, verify_chunk, and return the index to resume from.
+
+    Lines that are not valid JSON are flagged rather than stopping the run.
+    """
+    records = []
+    flagged = []
+    for index, record in chunk:
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except ValueError:
+                flagged.append(_flag(index, None, ["unparseable record"]))
+                continue
+        records.append((index, record))
+
+    flagged.extend(verify_chunk(records))
+    flagged.sort(key=lambda entry: entry['index'])
+    return chunk[-1][0] + 1, flagged
+
+
+def replay(path: str, workers: Optional[int] = None, checkpoint: Optional[str] = None,
+           chunk_size: int = CHUNK_SIZE) -> Iterator[Dict]:
+    """Verify a game history, yielding a dict for every flagged record.
+
+    With workers=1 everything runs in this process; otherwise chunks are
+    spread over a process pool (one worker per core by default) with a
+    bounded number in flight, so .jsonl input is never read far ahead.
+    Results come back in file order and the checkpoint is advanced after
+    each chunk.
+    """
+    source = os.path.abspath(path)
+    start = load_checkpoint(checkpoint, source)
+    chunks = _chunks(_iter_raw(path, start), chunk_size)
+
+    if workers == 1:
+        for next_index, flagged in map(_verify_with_end, chunks):
+            yield from flagged
+            if checkpoint:
+                save_checkpoint(checkpoint, source, next_index)
+        return
+
+    from multiprocessing import Pool
+
+    with Pool(workers) as pool:
+        in_flight = deque()
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+        for chunk in chunks:
+            in_flight.append(pool.apply_async(_verify_with_end, (chunk,)))
+            if len(in_flight) < max_in_flight:
+                continue
+            next_index, flagged = in_flight.popleft().get()
+            yield from flagged
+            if checkpoint:
+                save_checkpoint(checkpoint, source, next_index)
+        while in_flight:
+            next_index, flagged = in_flight.popleft().get()
+            yield from flagged
+            if checkpoint:
+                save_checkpoint(checkpoint, source, next_index)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Re-score recorded games and flag inconsistent records")
+    parser.add_argument('history', nargs='?', default='game_data.json',
+                        help="game_data.json or a .jsonl file with one game record per line")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--checkpoint', help="resume from and update this checkpoint file")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="records per work unit")
+    parser.add_argument('--output', help="write flagged records as JSON lines here instead of stdout")
+    args = parser.parse_args()
+
+    out = open(args.output, 'a') if args.output else sys.stdout
+    started = time.perf_counter()
+    count = 0
+    try:
+        for flagged in replay(args.history, args.workers, args.checkpoint, args.chunk_size):
+            out.write(json.dumps(flagged) + '\n')
+            count += 1
+    finally:
+        if args.output:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"{count} flagged records ({elapsed:.1f}s)", file=sys.stderr)
+    sys.exit(1 if count else 0)
+
+if __name__ == "__main__":
+    main()
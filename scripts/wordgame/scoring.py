@@ -0,0 +1,68 @@
+from typing import List, Sequence
+
+
+def check_guess(guess: str, target: str) -> List[str]:
+    """Check guess against target word and return color feedback"""
+    result = ['grey'] * 5
+    target_chars = list(target)
+    guess_chars = list(guess.upper())
+
+    # First pass: mark correct positions (green)
+    for i in range(5):
+        if guess_chars[i] == target_chars[i]:
+            result[i] = 'green'
+            target_chars[i] = None  # Mark as used
+            guess_chars[i] = None   # Mark as used
+
+    # Second pass: mark wrong positions (yellow)
+    for i in range(5):
+        if guess_chars[i] is not None:
+            if guess_chars[i] in target_chars:
+                result[i] = 'yellow'
+                # Remove first occurrence from target
+                target_chars[target_chars.index(guess_chars[i])] = None
+
+    return result
+
+
+def _load_numpy():
+    """Import NumPy on first use; None when it is not installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def check_guesses(guesses: Sequence[str], target: str) -> List[List[str]]:
+    """Score many guesses against one target.
+
+    Uses NumPy when available (imported lazily, so plain imports of this
+    module stay cheap) and falls back to check_guess otherwise.
+    """
+    np = _load_numpy()
+    if np is None or len(guesses) < 64:
+        return [check_guess(guess, target) for guess in guesses]
+
+    count = len(guesses)
+    letters = np.frombuffer(''.join(guesses).upper().encode('ascii'), dtype=np.uint8)
+    letters = (letters - 65).reshape(count, 5)
+    target_letters = np.frombuffer(target.encode('ascii'), dtype=np.uint8) - 65
+    rows = np.arange(count)
+
+    green = letters == target_letters
+    remaining = np.tile(np.bincount(target_letters, minlength=26), (count, 1))
+    for i in range(5):
+        rows_green = rows[green[:, i]]
+        remaining[rows_green, letters[rows_green, i]] -= 1
+
+    yellow = np.zeros_like(green)
+    for i in range(5):
+        column = letters[:, i]
+        hit = ~green[:, i] & (remaining[rows, column] > 0)
+        yellow[:, i] = hit
+        remaining[rows[hit], column[hit]] -= 1
+
+    codes = np.where(green, 2, np.where(yellow, 1, 0))
+    names = ('grey', 'yellow', 'green')
+    return [[names[code] for code in row] for row in codes.tolist()]
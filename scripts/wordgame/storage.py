@@ -0,0 +1,46 @@
+import json
+from typing import Dict, List, Optional
+
+
+class GameStore:
+    """User records and game history backed by a JSON file.
+
+    Nothing is read from disk until users or games is first accessed.
+    """
+
+    def __init__(self, data_file: str = "game_data.json"):
+        self.data_file = data_file
+        self._users: Optional[Dict] = None
+        self._games: Optional[List] = None
+
+    @property
+    def users(self) -> Dict:
+        if self._users is None:
+            self.load()
+        return self._users
+
+    @property
+    def games(self) -> List:
+        if self._games is None:
+            self.load()
+        return self._games
+
+    def load(self):
+        """Load user data and game history from JSON file"""
+        try:
+            with open(self.data_file, 'r') as f:
+                data = json.load(f)
+                self._users = data.get('users', {})
+                self._games = data.get('games', [])
+        except FileNotFoundError:
+            self._users = {}
+            self._games = []
+
+    def save(self):
+        """Save user data and game history to JSON file"""
+        data = {
+            'users': self.users,
+            'games': self.games
+        }
+        with open(self.data_file, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
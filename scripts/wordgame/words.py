@@ -0,0 +1,19 @@
+import random
+from datetime import date
+from typing import List
+
+WORDS = [
+    "AUDIO", "HOUSE", "PLANT", "WORLD", "MUSIC",
+    "LIGHT", "WATER", "POWER", "MONEY", "RIGHT",
+    "GREAT", "SMALL", "LARGE", "YOUNG", "EARLY",
+    "PLACE", "POINT", "HEART", "PARTY", "STORY"
+]
+
+
+def word_for_day(day: date, words: List[str] = WORDS) -> str:
+    """Get the daily word for a given date (same word for all players each day).
+
+    Seeding a private Random with the date ordinal gives the same pick as
+    random.seed(ordinal) without touching the global random state.
+    """
+    return random.Random(day.toordinal()).choice(words)